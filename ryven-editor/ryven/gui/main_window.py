@@ -581,7 +581,7 @@ CONTROLS
         required_packages = set()
         for node in self.core_session.all_node_objects():
             if (
-                node.__class__ not in self.node_packages.keys()
+                node.__class__ not in self.node_packages
                 or self.node_packages[node.__class__] is None
                 or self.node_packages[node.__class__].name == 'built_in'
             ):
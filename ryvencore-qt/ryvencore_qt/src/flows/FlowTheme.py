@@ -49,7 +49,7 @@ NodeWidget {
         pass
 
     def load(self, data: dict):
-        if data and self.name in data.keys():
+        if data and self.name in data:
             imported = {}
             for k, v in data[self.name].items():
                 if v != 'default':
@@ -972,7 +972,7 @@ class FlowView(GUIBase, QGraphicsView):
         # create item
         item: NodeItem = None
 
-        if node in self.node_items__cache.keys():  # load from cache
+        if node in self.node_items__cache:  # load from cache
             # print('using a cached item')
             item = self.node_items__cache[node]
             self._add_node_item(item)
@@ -1077,7 +1077,7 @@ class FlowView(GUIBase, QGraphicsView):
 
         # TODO: need to verify that connection_items_cache still works fine with new connection object
         item: ConnectionItem = None
-        if c in self.connection_items__cache.keys():
+        if c in self.connection_items__cache:
             item = self.connection_items__cache[c]
 
         else: